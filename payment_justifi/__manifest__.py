@@ -2,7 +2,7 @@
 
 {
     'name': 'Payment Provider: JustiFi',
-    'version': '19.0.1.1.2',
+    'version': '19.0.1.1.5',
     'category': 'Accounting/Payment Providers',
     'summary': 'Accept card and ACH payments via JustiFi payment processor.',
     'description': """
@@ -29,6 +29,9 @@ Configuration:
     'author': 'Jake Shumaker at Pulse Marketing',
     'website': 'https://justifi.ai/',
     'depends': ['payment', 'account', 'portal'],
+    'external_dependencies': {
+        'python': ['orjson'],
+    },
     'data': [
         'security/ir.model.access.csv',
         'views/payment_provider_views.xml',
@@ -36,6 +39,7 @@ Configuration:
         'views/account_move_terminal_payment_views.xml',
         'views/payment_templates.xml',
         'data/payment_provider_data.xml',
+        'data/ir_cron_data.xml',
     ],
     'application': False,
     'installable': True,
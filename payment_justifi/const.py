@@ -8,6 +8,42 @@ WEB_COMPONENT_TOKEN_URL = f'{API_BASE_URL}/v1/web_component_tokens'
 TERMINALS_URL = f'{API_BASE_URL}/v1/terminals'
 PAYMENTS_URL = f'{API_BASE_URL}/v1/payments'
 
+# Per-resource URL templates, filled with the resource ID using %
+CHECKOUT_URL = f'{CHECKOUTS_URL}/%s'
+CHECKOUT_COMPLETE_URL = f'{CHECKOUTS_URL}/%s/complete'
+PAYMENT_URL = f'{PAYMENTS_URL}/%s'
+PAYMENT_REFUNDS_URL = f'{PAYMENTS_URL}/%s/refunds'
+TERMINAL_PAY_URL = f'{TERMINALS_URL}/pay'
+TERMINAL_CANCEL_URL = f'{TERMINALS_URL}/cancel'
+
+# OAuth access token lifetime used when JustiFi omits expires_in, and how many
+# seconds before expiry a cached token is considered stale
+ACCESS_TOKEN_DEFAULT_LIFETIME = 3600
+ACCESS_TOKEN_EXPIRY_MARGIN = 30
+
+# (connect, read) timeouts for terminal, checkout status and OAuth token calls,
+# which sit on the POS hot path and must fail fast when JustiFi is slow
+FAIL_FAST_TIMEOUT = (5, 10)
+
+# Circuit breaker: after this many network errors or 5xx responses within the
+# window (seconds), JustiFi calls fail immediately for the cooldown (seconds)
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_WINDOW = 30
+BREAKER_COOLDOWN = 60
+
+# Checkouts in a final state are cached this many seconds, up to this many
+# entries, so polls racing a completed payment don't each hit JustiFi
+CHECKOUT_CACHE_TTL = 10
+CHECKOUT_CACHE_SIZE = 256
+
+# Pending transactions are re-read from JustiFi by cron once they have waited
+# this many seconds for a webhook, for up to this many days (ACH can take days).
+# One still pending after a re-read isn't fetched again for the interval (seconds).
+PENDING_SYNC_DELAY = 120
+PENDING_SYNC_INTERVAL = 3600
+PENDING_SYNC_MAX_AGE_DAYS = 7
+PENDING_SYNC_BATCH_SIZE = 50
+
 # Refund reasons accepted by JustiFi CreateRefund endpoint
 REFUND_REASONS = ('customer_request', 'fraud', 'duplicate')
 DEFAULT_REFUND_REASON = 'customer_request'
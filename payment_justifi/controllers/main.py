@@ -2,9 +2,10 @@
 
 import hashlib
 import hmac
-import json
 import logging
 
+import orjson
+
 from odoo import _, http
 from odoo.http import request
 from odoo.exceptions import ValidationError
@@ -29,7 +30,7 @@ class JustiFiController(http.Controller):
 
         :return: Redirect to payment status page
         """
-        _logger.info("JustiFi: Return endpoint called with data: %s", kwargs)
+        _logger.debug("JustiFi: Return endpoint called")
 
         # Redirect to the payment status page
         return request.redirect('/payment/status')
@@ -48,8 +49,6 @@ class JustiFiController(http.Controller):
 
         :return: Redirect to payment status page
         """
-        _logger.info("JustiFi: Complete endpoint called with: %s", kwargs)
-
         try:
             checkout_id = kwargs.get('checkout_id')
             payment_token = kwargs.get('payment_token')
@@ -60,8 +59,8 @@ class JustiFiController(http.Controller):
             partner_id = kwargs.get('partner_id')
             provider_id = kwargs.get('provider_id')
 
-            _logger.info("JustiFi: Complete params - checkout=%s, token=%s, amount=%s, currency=%s, partner=%s, provider=%s",
-                        checkout_id, payment_token, amount, currency_id, partner_id, provider_id)
+            _logger.debug("JustiFi: Complete params - checkout=%s, token=%s, amount=%s, currency=%s, partner=%s, provider=%s",
+                          checkout_id, payment_token, amount, currency_id, partner_id, provider_id)
 
             if not checkout_id:
                 _logger.error("JustiFi: Missing checkout_id")
@@ -75,10 +74,7 @@ class JustiFiController(http.Controller):
             if not tx:
                 _logger.warning("JustiFi: Transaction not found by checkout_id=%s, trying fallback", checkout_id)
                 # Fallback: find the most recent JustiFi transaction that hasn't been completed
-                provider = request.env['payment.provider'].sudo().search([
-                    ('code', '=', 'justifi'),
-                    ('state', '!=', 'disabled'),
-                ], limit=1)
+                provider = request.env['payment.provider']._justifi_get_active_provider()
                 if provider:
                     # Try draft/pending first
                     tx = request.env['payment.transaction'].sudo().search([
@@ -201,16 +197,30 @@ class JustiFiController(http.Controller):
                 _logger.error("JustiFi: Transaction not found for checkout_id=%s (even with fallback and creation attempt)", checkout_id)
                 return request.redirect('/payment/status')
 
+            # The webhook may already have settled the transaction
+            if tx.state in ('done', 'cancel'):
+                _logger.info("JustiFi: Transaction %s already %s, nothing to complete", tx.reference, tx.state)
+                return request.redirect('/payment/status')
+
             provider = tx.provider_id
 
             # If we have a payment token, complete the checkout with it
             if payment_token:
-                _logger.info("JustiFi: Completing checkout %s with payment token %s", checkout_id, payment_token)
+                _logger.debug("JustiFi: Completing checkout %s with payment token", checkout_id)
                 try:
                     checkout_data = provider._justifi_complete_checkout(checkout_id, payment_token)
                 except ValidationError as e:
                     _logger.error("JustiFi: Failed to complete checkout: %s", str(e))
                     return request.redirect('/payment/status')
+            elif payment_id and provider.justifi_webhook_secret:
+                # The frontend reported a payment ID, which it cannot prove. Record
+                # the transaction as pending and let the signed webhook set the
+                # final status instead of re-reading the checkout from JustiFi.
+                # The unproven ID is not stored: the transaction keeps its checkout
+                # reference, so if no webhook lands, _cron_justifi_sync_pending
+                # re-reads the checkout itself shortly after.
+                checkout_data = {'status': 'pending'}
+                payment_id = None
             else:
                 # No token, just verify the checkout status
                 try:
@@ -221,7 +231,7 @@ class JustiFiController(http.Controller):
 
             # Process the payment data
             checkout_data['checkout_id'] = checkout_id
-            if payment_id:
+            if payment_id and not checkout_data.get('successful_payment_id'):
                 checkout_data['successful_payment_id'] = payment_id
 
             tx._justifi_process_payment_data(checkout_data)
@@ -234,7 +244,7 @@ class JustiFiController(http.Controller):
             _logger.exception("JustiFi: Error in complete endpoint: %s", str(e))
             return request.redirect('/payment/status')
 
-    @http.route(_webhook_url, type='jsonrpc', auth='public', methods=['POST'], csrf=False)
+    @http.route(_webhook_url, type='http', auth='public', methods=['POST'], csrf=False)
     def justifi_webhook(self, **kwargs):
         """
         Handle webhooks from JustiFi.
@@ -244,39 +254,50 @@ class JustiFiController(http.Controller):
         - payment.failed
         - checkout.completed
 
-        :return: HTTP response
+        The raw body is read once and used both for the signature check and
+        for parsing, so the signature is always computed on the exact bytes
+        JustiFi sent.
+
+        :return: JSON HTTP response
         """
-        _logger.info("JustiFi: Webhook received")
+        _logger.debug("JustiFi: Webhook received")
 
         try:
-            data = request.jsonrequest
-            _logger.info("JustiFi: Webhook data: %s", json.dumps(data, indent=2))
-
-            event_type = data.get('event_type', '')
-            event_data = data.get('data', {})
+            raw_body = request.httprequest.get_data(cache=False)
 
             # Get signature from headers for verification
             signature = request.httprequest.headers.get('Justifi-Signature', '')
 
             # Find the provider to get webhook secret
-            provider = request.env['payment.provider'].sudo().search([
-                ('code', '=', 'justifi'),
-                ('state', '!=', 'disabled'),
-            ], limit=1)
+            provider = request.env['payment.provider']._justifi_get_active_provider()
 
             if not provider:
                 _logger.error("JustiFi: No active JustiFi provider found")
-                return {'status': 'error', 'message': 'Provider not found'}
+                return self._json_response({'status': 'error', 'message': 'Provider not found'})
 
-            # Verify webhook signature if secret is configured
+            # Verify webhook signature if secret is configured, before spending
+            # any time decoding a payload that may be rejected
             if provider.justifi_webhook_secret and signature:
                 if not self._verify_webhook_signature(
-                    request.httprequest.data,
+                    raw_body,
                     signature,
                     provider.justifi_webhook_secret
                 ):
                     _logger.error("JustiFi: Invalid webhook signature")
-                    return {'status': 'error', 'message': 'Invalid signature'}
+                    return self._json_response({'status': 'error', 'message': 'Invalid signature'})
+
+            data = orjson.loads(raw_body)
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug("JustiFi: Webhook data: %s", orjson.dumps(data).decode())
+
+            event_type = data.get('event_type', '')
+            event_data = data.get('data', {})
+
+            # JustiFi retries deliveries; acknowledge events for transactions that
+            # already reached a final state without touching them again
+            if self._is_duplicate_event(provider, event_data):
+                _logger.debug("JustiFi: Duplicate %s webhook for %s", event_type, event_data.get('id'))
+                return self._json_response({'status': 'ok', 'dedup': True})
 
             # Process based on event type
             if event_type in ('payment.succeeded', 'checkout.completed'):
@@ -288,31 +309,64 @@ class JustiFiController(http.Controller):
             else:
                 _logger.info("JustiFi: Unhandled event type: %s", event_type)
 
-            return {'status': 'ok'}
+            return self._json_response({'status': 'ok'})
 
         except Exception as e:
             _logger.exception("JustiFi: Error processing webhook: %s", str(e))
-            return {'status': 'error', 'message': str(e)}
+            return self._json_response({'status': 'error', 'message': str(e)})
+
+    def _is_duplicate_event(self, provider, event_data):
+        """
+        Check whether a webhook targets a transaction already in a final state.
+
+        :param provider: The payment provider
+        :param dict event_data: The ``data`` block from the webhook payload
+        :return: True if the matching transaction is done or canceled
+        """
+        references = [
+            ref for ref in (event_data.get('id'), event_data.get('successful_payment_id')) if ref
+        ]
+        if not references:
+            return False
+        return bool(request.env['payment.transaction'].sudo().search_count([
+            ('provider_reference', 'in', references),
+            ('provider_id', '=', provider.id),
+            ('state', 'in', ('done', 'cancel')),
+        ], limit=1))
+
+    def _json_response(self, payload):
+        """
+        Build a JSON HTTP response for the webhook.
+
+        :param dict payload: The response body
+        :return: HTTP response
+        """
+        return request.make_response(
+            orjson.dumps(payload),
+            headers=[('Content-Type', 'application/json')],
+        )
 
     def _verify_webhook_signature(self, payload, signature, secret):
         """
         Verify the webhook signature.
 
-        :param payload: Raw request body
-        :param signature: Signature from headers
-        :param secret: Webhook secret
+        The HMAC is fed the raw body through a memoryview and compared as a
+        raw digest, so the payload is never decoded, re-encoded or copied.
+
+        :param bytes payload: Raw request body
+        :param str signature: Hex-encoded signature from headers
+        :param str secret: Webhook secret
         :return: True if valid, False otherwise
         """
-        if isinstance(payload, bytes):
-            payload = payload.decode('utf-8')
+        try:
+            signature_bytes = bytes.fromhex(signature)
+        except ValueError:
+            return False
 
-        expected = hmac.new(
-            secret.encode('utf-8'),
-            payload.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        digest = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+        digest.update(memoryview(payload))
 
-        return hmac.compare_digest(expected, signature)
+        return hmac.compare_digest(digest.digest(), signature_bytes)
 
     def _handle_payment_success(self, provider, event_data):
         """
@@ -329,17 +383,12 @@ class JustiFiController(http.Controller):
             checkout_id, payment_id
         )
 
-        # Find the transaction
-        tx = None
-        if checkout_id:
-            tx = request.env['payment.transaction'].sudo().search([
-                ('provider_reference', '=', checkout_id),
-                ('provider_id', '=', provider.id),
-            ], limit=1)
-
-        if not tx and payment_id:
-            tx = request.env['payment.transaction'].sudo().search([
-                ('provider_reference', '=', payment_id),
+        # Find the transaction by checkout_id or payment_id in a single query
+        tx = request.env['payment.transaction']
+        references = [ref for ref in (checkout_id, payment_id) if ref]
+        if references:
+            tx = tx.sudo().search([
+                ('provider_reference', 'in', references),
                 ('provider_id', '=', provider.id),
             ], limit=1)
 
@@ -1,20 +1,45 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
+import copy
+import http.cookiejar
 import logging
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from odoo import api, fields, models, _
+from odoo import _, api, fields, models, tools
 from odoo.exceptions import ValidationError
 
+from odoo.addons.payment import utils as payment_utils
+
 from ..const import (
+    ACCESS_TOKEN_DEFAULT_LIFETIME,
+    ACCESS_TOKEN_EXPIRY_MARGIN,
+    FAIL_FAST_TIMEOUT,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_WINDOW,
+    BREAKER_COOLDOWN,
+    CHECKOUT_CACHE_TTL,
+    CHECKOUT_CACHE_SIZE,
     OAUTH_TOKEN_URL,
     CHECKOUTS_URL,
+    CHECKOUT_URL,
+    CHECKOUT_COMPLETE_URL,
     WEB_COMPONENT_TOKEN_URL,
-    TERMINALS_URL,
-    PAYMENTS_URL,
+    TERMINAL_PAY_URL,
+    TERMINAL_CANCEL_URL,
+    PAYMENT_URL,
+    PAYMENT_REFUNDS_URL,
     REFUND_REASONS,
     DEFAULT_REFUND_REASON,
+    STATUS_MAPPING,
     SUPPORTED_CURRENCIES,
     PAYMENT_METHOD_CODES_CARD,
     PAYMENT_METHOD_CODES_ACH,
@@ -23,6 +48,82 @@ from ..const import (
 
 _logger = logging.getLogger(__name__)
 
+# Process-wide OAuth token cache: {(dbname, provider_id, client_id): (token, expiry)}
+# where expiry is a time.monotonic() timestamp.
+_ACCESS_TOKEN_CACHE = {}
+# Token requests in flight, {cache_key: Future}: concurrent callers for the same
+# key wait on the one request (and share its failure) instead of each minting.
+# The lock only guards these dicts and is never held across the network call.
+_ACCESS_TOKEN_REQUESTS = {}
+_ACCESS_TOKEN_LOCK = threading.Lock()
+
+# LRU of checkouts that reached a final status:
+# {(dbname, provider_id, checkout_id): (expiry, checkout data)}, expiry being a
+# time.monotonic() timestamp.
+_CHECKOUT_CACHE = OrderedDict()
+_CHECKOUT_CACHE_LOCK = threading.Lock()
+
+
+def _make_session(max_retries):
+    """ Return a pooled HTTP session for api.justifi.ai.
+
+    :param max_retries: urllib3 retry policy for the HTTPS adapter
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=max_retries))
+    # JustiFi authenticates with bearer tokens; never store cookies, so nothing set
+    # for one provider's credentials is replayed on another's requests.
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+# Shared HTTP session so every call to api.justifi.ai reuses a pooled keep-alive
+# connection instead of paying a TCP + TLS handshake each time. Only idempotent
+# requests are retried by urllib3; POSTs are never replayed on a 5xx.
+_SESSION = _make_session(Retry(
+    total=2,
+    backoff_factor=0.2,
+    status_forcelist=[502, 503, 504],
+    raise_on_status=False,
+))
+# Session for the fail-fast paths (POS terminal, checkout status, OAuth token):
+# no urllib3 retries, so FAIL_FAST_TIMEOUT bounds the whole call.
+_FAST_SESSION = _make_session(0)
+
+# Process-wide circuit breaker state for the JustiFi API, see _breaker_record().
+# Timestamps are time.monotonic() values; opened_at is None while closed.
+_BREAKER = {'failures': 0, 'window_start': 0.0, 'opened_at': None}
+_BREAKER_LOCK = threading.Lock()
+
+
+def _breaker_is_open():
+    """ Return whether JustiFi calls should currently fail fast. """
+    opened_at = _BREAKER['opened_at']
+    return opened_at is not None and time.monotonic() - opened_at < BREAKER_COOLDOWN
+
+
+def _breaker_record(success):
+    """ Record the outcome of a JustiFi call, opening the breaker on repeated failures.
+
+    :param bool success: Whether JustiFi answered without a network error or 5xx
+    """
+    if success and not _BREAKER['failures'] and _BREAKER['opened_at'] is None:
+        return
+    now = time.monotonic()
+    with _BREAKER_LOCK:
+        if success:
+            _BREAKER.update(failures=0, opened_at=None)
+            return
+        if now - _BREAKER['window_start'] > BREAKER_WINDOW:
+            _BREAKER.update(failures=0, window_start=now)
+        _BREAKER['failures'] += 1
+        if _BREAKER['failures'] >= BREAKER_FAILURE_THRESHOLD:
+            _logger.warning(
+                "JustiFi: %s failures in %ss, failing fast for %ss",
+                _BREAKER['failures'], BREAKER_WINDOW, BREAKER_COOLDOWN,
+            )
+            _BREAKER['opened_at'] = now
+
 
 class PaymentProvider(models.Model):
     _inherit = 'payment.provider'
@@ -75,25 +176,42 @@ class PaymentProvider(models.Model):
 
     # === CONSTRAINT METHODS ===#
 
-    @api.constrains('justifi_account_id')
-    def _check_justifi_account_id(self):
-        for provider in self:
-            if provider.code == 'justifi' and provider.justifi_account_id:
-                if not provider.justifi_account_id.startswith('acc_'):
-                    raise ValidationError(_(
-                        "The Sub-Account ID should start with 'acc_'. "
-                        "Please check your JustiFi dashboard for the correct ID."
-                    ))
-
-    @api.constrains('justifi_payment_method_group_id')
-    def _check_justifi_payment_method_group_id(self):
-        for provider in self:
-            if provider.code == 'justifi' and provider.justifi_payment_method_group_id:
-                if not provider.justifi_payment_method_group_id.startswith('pmg_'):
-                    raise ValidationError(_(
-                        "The Payment Method Group ID should start with 'pmg_'. "
-                        "Please check your JustiFi dashboard for the correct ID."
-                    ))
+    @api.constrains('justifi_account_id', 'justifi_payment_method_group_id')
+    def _check_justifi_ids(self):
+        for provider in self.filtered(lambda p: p.code == 'justifi'):
+            if provider.justifi_account_id and not provider.justifi_account_id.startswith('acc_'):
+                raise ValidationError(_(
+                    "The Sub-Account ID should start with 'acc_'. "
+                    "Please check your JustiFi dashboard for the correct ID."
+                ))
+            if (provider.justifi_payment_method_group_id
+                    and not provider.justifi_payment_method_group_id.startswith('pmg_')):
+                raise ValidationError(_(
+                    "The Payment Method Group ID should start with 'pmg_'. "
+                    "Please check your JustiFi dashboard for the correct ID."
+                ))
+
+    # === CRUD METHODS ===#
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        providers = super().create(vals_list)
+        if any(provider.code == 'justifi' for provider in providers):
+            self.env.registry.clear_cache()  # Reset _justifi_get_active_provider_id
+        return providers
+
+    def write(self, vals):
+        res = super().write(vals)
+        if {'code', 'state', 'sequence', 'company_id'} & vals.keys():
+            self.env.registry.clear_cache()  # Reset _justifi_get_active_provider_id
+        return res
+
+    def unlink(self):
+        has_justifi = any(provider.code == 'justifi' for provider in self)
+        res = super().unlink()
+        if has_justifi:
+            self.env.registry.clear_cache()  # Reset _justifi_get_active_provider_id
+        return res
 
     # === COMPUTE METHODS ===#
 
@@ -111,9 +229,46 @@ class PaymentProvider(models.Model):
     def _get_supported_currencies(self):
         """ Override to return JustiFi's supported currencies. """
         if self.code == 'justifi':
-            return self.env['res.currency'].search([('name', 'in', SUPPORTED_CURRENCIES)])
+            return self.env['res.currency'].browse(self._justifi_get_supported_currency_ids())
         return super()._get_supported_currencies()
 
+    @api.model
+    @tools.ormcache()
+    def _justifi_get_supported_currency_ids(self):
+        """ Return the ids of JustiFi's supported currencies, cached per registry.
+
+        Inactive currencies are included so that activating one later does not
+        leave a stale empty result in the cache.
+        """
+        return tuple(self.env['res.currency'].with_context(active_test=False).search([
+            ('name', 'in', SUPPORTED_CURRENCIES),
+        ]).ids)
+
+    @api.model
+    @tools.ormcache('company_id')
+    def _justifi_get_active_provider_id(self, company_id=None):
+        """ Return the id of the first enabled JustiFi provider, or False.
+
+        Cached per registry; the cache is cleared whenever a provider's code, state,
+        sequence or company changes.
+
+        :param int company_id: Restrict the lookup to this company, if given
+        """
+        domain = [('code', '=', 'justifi'), ('state', '!=', 'disabled')]
+        if company_id:
+            domain.append(('company_id', '=', company_id))
+        return self.sudo().search(domain, limit=1).id
+
+    @api.model
+    def _justifi_get_active_provider(self, company=None):
+        """ Return the first enabled JustiFi provider, in sudo mode.
+
+        :param recordset company: Restrict the lookup to this company, as a
+                                  `res.company` record, if given
+        :return: The provider, as a sudoed `payment.provider` recordset
+        """
+        return self.sudo().browse(self._justifi_get_active_provider_id(company.id if company else None))
+
     def _get_default_payment_method_codes(self):
         """ Override to return JustiFi's default payment method codes based on config. """
         if self.code == 'justifi':
@@ -138,6 +293,9 @@ class PaymentProvider(models.Model):
         """
         Get OAuth access token from JustiFi API.
 
+        Tokens are cached per provider until shortly before they expire, so a
+        checkout flow only authenticates once instead of before every call.
+
         :return: Access token string
         :raises ValidationError: If authentication fails
         """
@@ -146,38 +304,144 @@ class PaymentProvider(models.Model):
         if not self.justifi_client_id or not self.justifi_client_secret:
             raise ValidationError(_("JustiFi Client ID and Client Secret are required."))
 
-        _logger.info("JustiFi: Requesting access token")
+        cache_key = self._justifi_get_access_token_cache_key()
+        cached = _ACCESS_TOKEN_CACHE.get(cache_key)
+        if cached and time.monotonic() < cached[1] - ACCESS_TOKEN_EXPIRY_MARGIN:
+            return cached[0]
+
+        with _ACCESS_TOKEN_LOCK:
+            # Another thread may have refreshed the token in the meantime
+            cached = _ACCESS_TOKEN_CACHE.get(cache_key)
+            if cached and time.monotonic() < cached[1] - ACCESS_TOKEN_EXPIRY_MARGIN:
+                return cached[0]
+            future = _ACCESS_TOKEN_REQUESTS.get(cache_key)
+            is_leader = future is None
+            if is_leader:
+                future = _ACCESS_TOKEN_REQUESTS[cache_key] = Future()
+
+        if not is_leader:
+            # Returns the leader's token, or raises the leader's error
+            return future.result()
 
         try:
-            response = requests.post(
+            access_token, expires_in = self._justifi_request_access_token()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            _ACCESS_TOKEN_CACHE[cache_key] = (access_token, time.monotonic() + expires_in)
+            future.set_result(access_token)
+        finally:
+            with _ACCESS_TOKEN_LOCK:
+                _ACCESS_TOKEN_REQUESTS.pop(cache_key, None)
+
+        return access_token
+
+    def _justifi_request_access_token(self):
+        """
+        Request a new OAuth access token from JustiFi.
+
+        :return: Tuple of (access token, lifetime in seconds)
+        :raises ValidationError: If authentication fails
+        """
+        _logger.debug("JustiFi: Requesting access token")
+
+        try:
+            response = _FAST_SESSION.post(
                 OAUTH_TOKEN_URL,
-                json={
+                data=orjson.dumps({
                     'client_id': self.justifi_client_id,
                     'client_secret': self.justifi_client_secret,
-                },
+                }),
                 headers={'Content-Type': 'application/json'},
-                timeout=30,
+                timeout=FAIL_FAST_TIMEOUT,
             )
         except requests.exceptions.RequestException as e:
+            _breaker_record(success=False)
             _logger.error("JustiFi: Network error getting access token: %s", str(e))
             raise ValidationError(_("Could not connect to JustiFi. Please try again later."))
 
+        # Every call starts here when the token expires, so an OAuth outage must
+        # trip the breaker like any other
+        _breaker_record(success=response.status_code < 500)
+
         if response.status_code != 200:
             _logger.error(
                 "JustiFi: Failed to get access token. Status: %s, Response: %s",
-                response.status_code, response.text
+                response.status_code, response.text[:512]
             )
             raise ValidationError(_("JustiFi authentication failed. Please check your credentials."))
 
-        data = response.json()
+        data = orjson.loads(response.content)
         access_token = data.get('access_token')
 
         if not access_token:
             _logger.error("JustiFi: No access token in response: %s", data)
             raise ValidationError(_("JustiFi authentication failed. No access token received."))
 
-        _logger.info("JustiFi: Access token obtained successfully")
-        return access_token
+        _logger.debug("JustiFi: Access token obtained successfully")
+        return access_token, data.get('expires_in') or ACCESS_TOKEN_DEFAULT_LIFETIME
+
+    def _justifi_get_access_token_cache_key(self):
+        """ Return the key under which this provider's access token is cached. """
+        return (self.env.cr.dbname, self.id, self.justifi_client_id)
+
+    def _justifi_invalidate_access_token(self):
+        """ Drop the cached access token so the next call gets a fresh one. """
+        _ACCESS_TOKEN_CACHE.pop(self._justifi_get_access_token_cache_key(), None)
+
+    def _justifi_make_request(self, method, url, headers=None, fail_fast=False, **kwargs):
+        """
+        Send an authenticated request to the JustiFi API.
+
+        The Authorization header is built from the cached access token. If
+        JustiFi rejects the token (401), it is evicted and the request is
+        retried once with a fresh token. Network errors are left to the caller.
+
+        Network errors and 5xx responses, including those of the OAuth token
+        request, feed a process-wide circuit breaker; while it is open, calls
+        are refused before reaching JustiFi so workers aren't tied up waiting
+        on timeouts during an outage.
+
+        :param str method: HTTP method ('GET', 'POST', ...)
+        :param str url: Full API URL
+        :param dict headers: Extra headers (e.g. Sub-Account, Idempotency-Key)
+        :param bool fail_fast: Send without urllib3 retries, so the timeout is
+                               the overall bound (POS and status paths)
+        :return: The HTTP response
+        :raises requests.exceptions.RequestException: On network error
+        :raises ValidationError: If authentication fails or the circuit breaker is open
+        """
+        self.ensure_one()
+
+        if _breaker_is_open():
+            raise ValidationError(_("JustiFi is temporarily unavailable. Please try again in a minute."))
+
+        # Serialize JSON bodies with orjson rather than letting requests use json
+        if 'json' in kwargs:
+            kwargs['data'] = orjson.dumps(kwargs.pop('json'))
+
+        session = _FAST_SESSION if fail_fast else _SESSION
+
+        def _send():
+            request_headers = {
+                'Authorization': f'Bearer {self._justifi_get_access_token()}',
+                'Content-Type': 'application/json',
+                **(headers or {}),
+            }
+            return session.request(method, url, headers=request_headers, **kwargs)
+
+        try:
+            response = _send()
+            if response.status_code == 401:
+                _logger.info("JustiFi: Access token rejected, retrying with a fresh token")
+                self._justifi_invalidate_access_token()
+                response = _send()
+        except requests.exceptions.RequestException:
+            _breaker_record(success=False)
+            raise
+        _breaker_record(success=response.status_code < 500)
+        return response
 
     def _justifi_create_checkout(self, amount, currency, description, origin_url):
         """
@@ -192,17 +456,9 @@ class PaymentProvider(models.Model):
         """
         self.ensure_one()
 
-        access_token = self._justifi_get_access_token()
-
         if not self.justifi_account_id:
             raise ValidationError(_("JustiFi Sub-Account ID is required."))
 
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json',
-            'Sub-Account': self.justifi_account_id,
-        }
-
         checkout_data = {
             'amount': amount,
             'currency': currency.lower(),
@@ -214,13 +470,18 @@ class PaymentProvider(models.Model):
         if self.justifi_payment_method_group_id:
             checkout_data['payment_method_group_id'] = self.justifi_payment_method_group_id
 
-        _logger.info("JustiFi: Creating checkout with data: %s", checkout_data)
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "JustiFi: Creating checkout amount=%s currency=%s",
+                checkout_data.get('amount'), checkout_data.get('currency'),
+            )
 
         try:
-            response = requests.post(
+            response = self._justifi_make_request(
+                'POST',
                 CHECKOUTS_URL,
+                headers={'Sub-Account': self.justifi_account_id},
                 json=checkout_data,
-                headers=headers,
                 timeout=30,
             )
         except requests.exceptions.RequestException as e:
@@ -230,18 +491,18 @@ class PaymentProvider(models.Model):
         if response.status_code >= 400:
             _logger.error(
                 "JustiFi: Failed to create checkout. Status: %s, Response: %s",
-                response.status_code, response.text
+                response.status_code, response.text[:512]
             )
             error_msg = "Failed to create checkout"
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 if 'error' in error_data and 'message' in error_data['error']:
                     error_msg = error_data['error']['message']
             except Exception:
                 pass
             raise ValidationError(_("JustiFi: %s") % error_msg)
 
-        data = response.json()
+        data = orjson.loads(response.content)
         checkout = data.get('data', data)
 
         if not checkout.get('id'):
@@ -264,27 +525,20 @@ class PaymentProvider(models.Model):
         """
         self.ensure_one()
 
-        access_token = self._justifi_get_access_token()
-
         # Build resources array - checkout AND tokenize permissions required
         resources = [
             f'write:checkout:{checkout_id}',
             f'write:tokenize:{self.justifi_account_id}',
         ]
 
-        # Note: Sub-Account header is NOT included here - causes auth failures
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json',
-        }
-
-        _logger.info("JustiFi: Requesting web component token for checkout: %s", checkout_id)
+        _logger.debug("JustiFi: Requesting web component token for checkout: %s", checkout_id)
 
         try:
-            response = requests.post(
+            # Note: Sub-Account header is NOT included here - causes auth failures
+            response = self._justifi_make_request(
+                'POST',
                 WEB_COMPONENT_TOKEN_URL,
                 json={'resources': resources},
-                headers=headers,
                 timeout=30,
             )
         except requests.exceptions.RequestException as e:
@@ -294,18 +548,18 @@ class PaymentProvider(models.Model):
         if response.status_code != 200:
             _logger.error(
                 "JustiFi: Failed to get web component token. Status: %s, Response: %s",
-                response.status_code, response.text
+                response.status_code, response.text[:512]
             )
             raise ValidationError(_("JustiFi: Failed to initialize payment form."))
 
-        data = response.json()
+        data = orjson.loads(response.content)
         token = data.get('access_token')
 
         if not token:
             _logger.error("JustiFi: No web component token in response: %s", data)
             raise ValidationError(_("JustiFi: Failed to initialize payment form."))
 
-        _logger.info("JustiFi: Web component token obtained for checkout: %s", checkout_id)
+        _logger.debug("JustiFi: Web component token obtained for checkout: %s", checkout_id)
         return token
 
     def _justifi_get_inline_form_values(self, amount, currency, partner_id, is_validation=False, **kwargs):
@@ -327,8 +581,8 @@ class PaymentProvider(models.Model):
             # For validation (saving payment method), we don't need a checkout
             return {}
 
-        # Convert amount to cents
-        amount_cents = int(amount * 100)
+        # Convert amount to minor units (cents for USD)
+        amount_cents = payment_utils.to_minor_currency_units(amount, currency)
 
         # Get base URL
         base_url = self.get_base_url()
@@ -345,8 +599,8 @@ class PaymentProvider(models.Model):
 
         # Try to find the pending transaction for this payment and store checkout_id
         # Note: In some Odoo flows, the transaction may not exist yet when form renders
-        _logger.info("JustiFi: Looking for transaction with provider_id=%s, amount=%s, currency=%s",
-                     self.id, amount, currency.id)
+        _logger.debug("JustiFi: Looking for transaction with provider_id=%s, amount=%s, currency=%s",
+                      self.id, amount, currency.id)
 
         # First try exact match with amount
         tx = self.env['payment.transaction'].sudo().search([
@@ -396,13 +650,13 @@ class PaymentProvider(models.Model):
             _logger.info("JustiFi: Found invoice %s from transaction", invoice.name)
 
         # If no transaction/invoice found, try to find invoice by amount
-        _logger.info("JustiFi: Invoice lookup - tx=%s, partner_id=%s, amount=%s, type=%s",
-                    tx, partner_id, amount, type(amount))
+        _logger.debug("JustiFi: Invoice lookup - tx=%s, partner_id=%s, amount=%s, type=%s",
+                     tx, partner_id, amount, type(amount))
         if not invoice and amount:
             # Use rounded comparison for amount (avoids float precision issues)
             rounded_amount = round(float(amount), 2)
-            _logger.info("JustiFi: Searching for invoice with amount=%s (rounded=%s)",
-                        amount, rounded_amount)
+            _logger.debug("JustiFi: Searching for invoice with amount=%s (rounded=%s)",
+                         amount, rounded_amount)
 
             # Search for unpaid invoices, ordered by most recent first
             invoices = self.env['account.move'].sudo().search([
@@ -411,12 +665,12 @@ class PaymentProvider(models.Model):
                 ('payment_state', 'in', ['not_paid', 'partial']),
             ], order='id desc', limit=10)
 
-            _logger.info("JustiFi: Found %s unpaid invoices to check", len(invoices))
+            _logger.debug("JustiFi: Found %s unpaid invoices to check", len(invoices))
 
             # First pass: try to match by both partner and amount
             for inv in invoices:
-                _logger.info("JustiFi:   - %s: partner=%s, residual=%s, methods=%s",
-                            inv.name, inv.partner_id.id, inv.amount_residual, inv.justifi_payment_methods)
+                _logger.debug("JustiFi:   - %s: partner=%s, residual=%s, methods=%s",
+                             inv.name, inv.partner_id.id, inv.amount_residual, inv.justifi_payment_methods)
                 if inv.partner_id.id == partner_id and abs(inv.amount_residual - rounded_amount) < 0.01:
                     invoice = inv
                     _logger.info("JustiFi: Matched invoice %s (partner + amount match)", invoice.name)
@@ -453,26 +707,31 @@ class PaymentProvider(models.Model):
         """
         Get checkout details from JustiFi.
 
+        Checkouts in a final status are served from a short-lived cache, so
+        status polls racing a completed payment don't each call JustiFi.
+
         :param checkout_id: The checkout ID to retrieve
         :return: Checkout data dict
         :raises ValidationError: If request fails
         """
         self.ensure_one()
 
-        access_token = self._justifi_get_access_token()
+        cache_key = (self.env.cr.dbname, self.id, checkout_id)
+        with _CHECKOUT_CACHE_LOCK:
+            cached = _CHECKOUT_CACHE.get(cache_key)
+            if cached and time.monotonic() < cached[0]:
+                _CHECKOUT_CACHE.move_to_end(cache_key)
+                return copy.deepcopy(cached[1])
 
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json',
-            'Sub-Account': self.justifi_account_id,
-        }
+        url = CHECKOUT_URL % checkout_id
 
-        url = f'{CHECKOUTS_URL}/{checkout_id}'
-
-        _logger.info("JustiFi: Getting checkout: %s", checkout_id)
+        _logger.debug("JustiFi: Getting checkout: %s", checkout_id)
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self._justifi_make_request(
+                'GET', url, headers={'Sub-Account': self.justifi_account_id},
+                fail_fast=True, timeout=FAIL_FAST_TIMEOUT,
+            )
         except requests.exceptions.RequestException as e:
             _logger.error("JustiFi: Network error getting checkout: %s", str(e))
             raise ValidationError(_("Could not connect to JustiFi. Please try again later."))
@@ -480,12 +739,23 @@ class PaymentProvider(models.Model):
         if response.status_code >= 400:
             _logger.error(
                 "JustiFi: Failed to get checkout. Status: %s, Response: %s",
-                response.status_code, response.text
+                response.status_code, response.text[:512]
             )
             raise ValidationError(_("JustiFi: Failed to verify payment status."))
 
-        data = response.json()
-        return data.get('data', data)
+        data = orjson.loads(response.content)
+        checkout = data.get('data', data)
+
+        # Final statuses can't change anymore; pending ones must be refetched
+        if STATUS_MAPPING.get(checkout.get('status')) in ('done', 'error', 'cancel'):
+            with _CHECKOUT_CACHE_LOCK:
+                _CHECKOUT_CACHE[cache_key] = (
+                    time.monotonic() + CHECKOUT_CACHE_TTL, copy.deepcopy(checkout),
+                )
+                _CHECKOUT_CACHE.move_to_end(cache_key)
+                while len(_CHECKOUT_CACHE) > CHECKOUT_CACHE_SIZE:
+                    _CHECKOUT_CACHE.popitem(last=False)
+        return checkout
 
     def _justifi_complete_checkout(self, checkout_id, payment_token):
         """
@@ -496,22 +766,17 @@ class PaymentProvider(models.Model):
         :return: Checkout data dict with payment result
         :raises ValidationError: If completion fails
         """
-        import uuid
         self.ensure_one()
 
-        access_token = self._justifi_get_access_token()
-
         # Generate idempotency key for this request
         idempotency_key = str(uuid.uuid4())
 
         headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json',
             'Sub-Account': self.justifi_account_id,
             'Idempotency-Key': idempotency_key,
         }
 
-        url = f'{CHECKOUTS_URL}/{checkout_id}/complete'
+        url = CHECKOUT_COMPLETE_URL % checkout_id
 
         # Per JustiFi API docs: use 'payment_token' not 'payment_method_id'
         payload = {
@@ -519,39 +784,51 @@ class PaymentProvider(models.Model):
             'payment_mode': 'ecom',  # ecommerce payment
         }
 
-        _logger.info("JustiFi: Completing checkout %s with token %s (idempotency: %s)",
-                     checkout_id, payment_token, idempotency_key)
+        _logger.debug("JustiFi: Completing checkout %s (idempotency: %s)", checkout_id, idempotency_key)
 
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = self._justifi_make_request('POST', url, headers=headers, json=payload, timeout=30)
         except requests.exceptions.RequestException as e:
             _logger.error("JustiFi: Network error completing checkout: %s", str(e))
             raise ValidationError(_("Could not connect to JustiFi. Please try again later."))
 
-        _logger.info("JustiFi: Complete checkout response: %s %s",
-                     response.status_code, response.text[:500] if response.text else '')
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("JustiFi: Complete checkout response: %s %s",
+                          response.status_code, response.text[:512])
 
         if response.status_code >= 400:
             _logger.error(
                 "JustiFi: Failed to complete checkout. Status: %s, Response: %s",
-                response.status_code, response.text
+                response.status_code, response.text[:512]
             )
             error_msg = "Payment failed"
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 if 'error' in error_data and 'message' in error_data['error']:
                     error_msg = error_data['error']['message']
             except Exception:
                 pass
             raise ValidationError(_("JustiFi: %s") % error_msg)
 
-        data = response.json()
+        data = orjson.loads(response.content)
         checkout_data = data.get('data', data)
 
         _logger.info("JustiFi: Checkout completed. Status: %s", checkout_data.get('status'))
 
         return checkout_data
 
+    def _justifi_terminal_headers(self, extra=None):
+        """
+        Return the headers shared by terminal pay and cancel requests.
+
+        Authorization is not included: :meth:`_justifi_make_request` adds it
+        from the cached access token, which keeps it valid across refreshes.
+
+        :param dict extra: Additional headers, e.g. the Idempotency-Key
+        :return: dict of headers
+        """
+        return {'Sub-Account': self.justifi_account_id, **(extra or {})}
+
     def _justifi_send_to_terminal(self, terminal_id, checkout_id):
         """
         Send a checkout to a JustiFi terminal for payment.
@@ -562,25 +839,20 @@ class PaymentProvider(models.Model):
         """
         self.ensure_one()
 
-        access_token = self._justifi_get_access_token()
-
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json',
-            'Sub-Account': self.justifi_account_id,
-            'Idempotency-Key': str(uuid.uuid4()),
-        }
+        headers = self._justifi_terminal_headers({'Idempotency-Key': str(uuid.uuid4())})
 
-        url = f'{TERMINALS_URL}/pay'
+        url = TERMINAL_PAY_URL
         payload = {
             'checkout_id': checkout_id,
             'terminal_id': terminal_id,
         }
 
-        _logger.info("JustiFi: Sending checkout %s to terminal %s", checkout_id, terminal_id)
+        _logger.debug("JustiFi: Sending checkout %s to terminal %s", checkout_id, terminal_id)
 
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = self._justifi_make_request(
+                'POST', url, headers=headers, json=payload, fail_fast=True, timeout=FAIL_FAST_TIMEOUT,
+            )
         except requests.exceptions.RequestException as e:
             _logger.error("JustiFi: Network error sending to terminal: %s", str(e))
             raise ValidationError(_("Could not connect to JustiFi terminal. Please try again."))
@@ -588,18 +860,18 @@ class PaymentProvider(models.Model):
         if response.status_code >= 400:
             _logger.error(
                 "JustiFi: Failed to send to terminal. Status: %s, Response: %s",
-                response.status_code, response.text
+                response.status_code, response.text[:512]
             )
             error_msg = "Failed to send payment to terminal"
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 if 'error' in error_data and 'message' in error_data['error']:
                     error_msg = error_data['error']['message']
             except Exception:
                 pass
             raise ValidationError(_("JustiFi: %s") % error_msg)
 
-        data = response.json()
+        data = orjson.loads(response.content)
         return data.get('data', data)
 
     def _justifi_cancel_terminal_action(self, terminal_id, checkout_id):
@@ -612,15 +884,11 @@ class PaymentProvider(models.Model):
         """
         self.ensure_one()
 
-        access_token = self._justifi_get_access_token()
-
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json',
-            'Sub-Account': self.justifi_account_id,
-        }
+        # No Idempotency-Key: a cancel that failed (e.g. sent before the terminal
+        # picked up the action) must reach the terminal again when retried
+        headers = self._justifi_terminal_headers()
 
-        url = f'{TERMINALS_URL}/cancel'
+        url = TERMINAL_CANCEL_URL
         payload = {
             'checkout_id': checkout_id,
             'terminal_id': terminal_id,
@@ -629,16 +897,18 @@ class PaymentProvider(models.Model):
         _logger.info("JustiFi: Cancelling terminal %s for checkout %s", terminal_id, checkout_id)
 
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = self._justifi_make_request(
+                'POST', url, headers=headers, json=payload, fail_fast=True, timeout=FAIL_FAST_TIMEOUT,
+            )
         except requests.exceptions.RequestException as e:
             _logger.warning("JustiFi: Network error cancelling terminal: %s", str(e))
             return {}
 
         if response.status_code >= 400:
-            _logger.warning("JustiFi: Cancel may have failed: %s", response.text)
+            _logger.warning("JustiFi: Cancel may have failed: %s", response.text[:512])
 
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get('data', data)
         except Exception:
             return {}
@@ -656,19 +926,15 @@ class PaymentProvider(models.Model):
         :returns: dict with payment details
         """
         self.ensure_one()
-        access_token = self._justifi_get_access_token()
 
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json',
-            'Sub-Account': self.justifi_account_id,
-        }
+        headers = {'Sub-Account': self.justifi_account_id}
 
         _logger.info("JustiFi: Getting payment details for %s", payment_id)
 
         try:
-            response = requests.get(
-                f'{PAYMENTS_URL}/{payment_id}',
+            response = self._justifi_make_request(
+                'GET',
+                PAYMENT_URL % payment_id,
                 headers=headers,
                 timeout=15,
             )
@@ -680,7 +946,7 @@ class PaymentProvider(models.Model):
                 )
                 return {}
 
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get('data', {})
 
         except Exception as exc:
@@ -719,11 +985,7 @@ class PaymentProvider(models.Model):
                 "JustiFi: Refund reason '%s' is not supported. Use one of: %s"
             ) % (reason, ', '.join(REFUND_REASONS)))
 
-        access_token = self._justifi_get_access_token()
-
         headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json',
             'Sub-Account': self.justifi_account_id,
             'Idempotency-Key': idempotency_key,
         }
@@ -737,7 +999,7 @@ class PaymentProvider(models.Model):
         if metadata:
             payload['metadata'] = metadata
 
-        url = f'{PAYMENTS_URL}/{payment_id}/refunds'
+        url = PAYMENT_REFUNDS_URL % payment_id
 
         _logger.info(
             "JustiFi: Creating refund for payment %s, amount=%s cents, reason=%s, idem=%s",
@@ -745,7 +1007,7 @@ class PaymentProvider(models.Model):
         )
 
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = self._justifi_make_request('POST', url, headers=headers, json=payload, timeout=30)
         except requests.exceptions.RequestException as e:
             _logger.error("JustiFi: Network error creating refund: %s", str(e))
             raise ValidationError(_("Could not connect to JustiFi. Please try again later."))
@@ -753,11 +1015,11 @@ class PaymentProvider(models.Model):
         if response.status_code >= 400:
             _logger.error(
                 "JustiFi: Failed to create refund. Status: %s, Response: %s",
-                response.status_code, response.text,
+                response.status_code, response.text[:512],
             )
             error_msg = "Refund failed"
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 if 'error' in error_data and 'message' in error_data['error']:
                     error_msg = error_data['error']['message']
                 elif 'errors' in error_data and error_data['errors']:
@@ -767,7 +1029,7 @@ class PaymentProvider(models.Model):
                 pass
             raise ValidationError(_("JustiFi: %s") % error_msg)
 
-        data = response.json()
+        data = orjson.loads(response.content)
         refund = data.get('data', data)
         _logger.info(
             "JustiFi: Refund created: id=%s, status=%s",
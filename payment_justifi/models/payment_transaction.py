@@ -1,18 +1,51 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
 import logging
+from collections import defaultdict
+from datetime import timedelta
 
-from odoo import _, models
+from odoo import _, api, fields, models
 from odoo.exceptions import ValidationError
 
-from ..const import STATUS_MAPPING, DEFAULT_REFUND_REASON
+from odoo.addons.payment import utils as payment_utils
+
+from ..const import (
+    STATUS_MAPPING,
+    DEFAULT_REFUND_REASON,
+    PENDING_SYNC_DELAY,
+    PENDING_SYNC_INTERVAL,
+    PENDING_SYNC_MAX_AGE_DAYS,
+    PENDING_SYNC_BATCH_SIZE,
+)
 
 _logger = logging.getLogger(__name__)
 
+# Odoo transaction state -> method applying it from JustiFi payment data
+_JUSTIFI_STATE_HANDLERS = {
+    'done': '_justifi_apply_done',
+    'pending': '_justifi_apply_pending',
+    'error': '_justifi_apply_error',
+    'cancel': '_justifi_apply_cancel',
+}
+
 
 class PaymentTransaction(models.Model):
     _inherit = 'payment.transaction'
 
+    # Webhooks, the complete endpoint and refunds all look transactions up by
+    # their JustiFi checkout/payment/refund ID; most rows never get one.
+    provider_reference = fields.Char(index='btree_not_null')
+    justifi_last_sync = fields.Datetime(
+        string="JustiFi Last Sync",
+        help="When the pending-payment cron last re-read this transaction from JustiFi.",
+        readonly=True,
+        copy=False,
+    )
+
+    # The inline form links a new checkout to the provider's latest unlinked
+    # draft/pending transaction; serve that lookup without scanning every row.
+    _justifi_unlinked_idx = models.Index("(provider_id, state, id) WHERE provider_reference IS NULL")
+
     # === BUSINESS METHODS ===#
 
     def _get_specific_rendering_values(self, processing_values):
@@ -33,8 +66,8 @@ class PaymentTransaction(models.Model):
 
         provider = self.provider_id
 
-        # Convert amount to cents (JustiFi expects integer cents)
-        amount_cents = int(self.amount * 100)
+        # Convert amount to minor units (JustiFi expects integer cents)
+        amount_cents = payment_utils.to_minor_currency_units(self.amount, self.currency_id)
 
         # Get the base URL for origin
         base_url = self.provider_id.get_base_url()
@@ -53,16 +86,16 @@ class PaymentTransaction(models.Model):
 
         checkout_id = checkout['id']
 
-        # Store checkout_id in provider_reference for later lookup
-        self.provider_reference = checkout_id
-
-        # Get web component token
+        # Get web component token (scoped to the checkout, so it can't be cached)
         try:
             auth_token = provider._justifi_get_web_component_token(checkout_id)
         except ValidationError as e:
             _logger.error("JustiFi: Failed to get web component token for %s: %s", checkout_id, str(e))
             raise
 
+        # Store checkout_id in provider_reference for later lookup
+        self.provider_reference = checkout_id
+
         _logger.info(
             "JustiFi: Rendering values for transaction %s: checkout_id=%s",
             self.reference, checkout_id
@@ -113,6 +146,74 @@ class PaymentTransaction(models.Model):
         :param dict payment_data: Payment data from JustiFi
         :return: None
         """
+        odoo_state = self._justifi_prepare_payment_data(payment_data)
+
+        # Update transaction state
+        handler = _JUSTIFI_STATE_HANDLERS.get(odoo_state)
+        if handler:
+            getattr(self, handler)(payment_data)
+
+    @api.model
+    def _justifi_process_payment_data_multi(self, provider, payment_data_list):
+        """
+        Process a batch of JustiFi payment data, e.g. when replaying webhooks.
+
+        Transactions are fetched in a single query, and those moving to the
+        same state (with the same message) are transitioned together, so
+        ``_post_process`` runs once for all the confirmed ones.
+
+        :param provider: The JustiFi payment provider
+        :param list payment_data_list: Payment data dicts from JustiFi
+        :return: The transactions whose state changed
+        """
+        references = set()
+        for payment_data in payment_data_list:
+            references.update(
+                payment_data.get(key) for key in ('checkout_id', 'id', 'successful_payment_id')
+            )
+        references.discard(None)
+        references.discard('')
+        txs = self.search([
+            ('provider_reference', 'in', list(references)),
+            ('provider_id', '=', provider.id),
+        ])
+        # provider_reference changes while processing; match on the references as fetched
+        tx_by_reference = {tx.provider_reference: tx for tx in txs}
+
+        # Group transactions by (state, error message) so each group changes state at once
+        txs_by_change = defaultdict(self.browse)
+        data_by_change = {}
+        for payment_data in payment_data_list:
+            checkout_id = payment_data.get('checkout_id') or payment_data.get('id')
+            tx = tx_by_reference.get(checkout_id) or tx_by_reference.get(
+                payment_data.get('successful_payment_id')
+            )
+            if not tx:
+                _logger.warning("JustiFi: No transaction found for checkout %s", checkout_id)
+                continue
+            odoo_state = tx._justifi_prepare_payment_data(payment_data)
+            if odoo_state not in _JUSTIFI_STATE_HANDLERS:
+                continue
+            message = None
+            if odoo_state == 'error':
+                message = (payment_data.get('error') or {}).get('message')
+            change = (odoo_state, message)
+            txs_by_change[change] |= tx
+            data_by_change[change] = payment_data
+
+        processed_txs = self.browse()
+        for change, group_txs in txs_by_change.items():
+            getattr(group_txs, _JUSTIFI_STATE_HANDLERS[change[0]])(data_by_change[change])
+            processed_txs |= group_txs
+        return processed_txs
+
+    def _justifi_prepare_payment_data(self, payment_data):
+        """
+        Record the JustiFi reference from payment data and resolve the target state.
+
+        :param dict payment_data: Payment data from JustiFi
+        :return: The Odoo state to move to, or None if the transaction is already in it
+        """
         self.ensure_one()
 
         checkout_id = payment_data.get('checkout_id') or payment_data.get('id')
@@ -127,29 +228,126 @@ class PaymentTransaction(models.Model):
         # Map JustiFi status to Odoo transaction state
         odoo_state = STATUS_MAPPING.get(status, 'pending')
 
-        # Store the payment ID as provider reference if available
-        if payment_id:
-            self.provider_reference = payment_id
-        elif checkout_id and not self.provider_reference:
-            self.provider_reference = checkout_id
+        # Store the payment ID as provider reference if available, writing
+        # only when it actually changes so replays don't flush anything
+        reference = payment_id or self.provider_reference or checkout_id
+        if reference and reference != self.provider_reference:
+            self.write({'provider_reference': reference})
+
+        # JustiFi retries notifications; don't re-run the state change (and the
+        # reconciliation in _post_process) for a transaction already there
+        if self.state == odoo_state:
+            _logger.debug("JustiFi: Transaction %s already %s, skipping", self.reference, odoo_state)
+            return None
+        return odoo_state
+
+    def _justifi_apply_done(self, payment_data):
+        """ Confirm the transactions and reconcile their invoices right away.
+
+        Post-processing runs once for the whole recordset. If that fails, it is
+        retried per transaction, each in its own savepoint, so one bad invoice
+        doesn't leave the others unreconciled.
+        """
+        self._set_done()
+        # Trigger immediate post-processing to reconcile invoice
+        # This creates the payment and marks the invoice as paid
+        try:
+            with self.env.cr.savepoint():
+                self._post_process()
+            _logger.info(
+                "JustiFi: Post-processing completed for transaction %s", ', '.join(self.mapped('reference'))
+            )
+            return
+        except Exception as e:
+            if len(self) == 1:
+                _logger.exception("JustiFi: Post-processing failed for transaction %s: %s", self.reference, str(e))
+                return
 
-        # Update transaction state
-        if odoo_state == 'done':
-            self._set_done()
-            # Trigger immediate post-processing to reconcile invoice
-            # This creates the payment and marks the invoice as paid
+        for tx in self:
             try:
-                self._post_process()
-                _logger.info("JustiFi: Post-processing completed for transaction %s", self.reference)
+                with self.env.cr.savepoint():
+                    tx._post_process()
+                _logger.info("JustiFi: Post-processing completed for transaction %s", tx.reference)
             except Exception as e:
-                _logger.exception("JustiFi: Post-processing failed for transaction %s: %s", self.reference, str(e))
-        elif odoo_state == 'pending':
-            self._set_pending()
-        elif odoo_state == 'error':
-            error_msg = payment_data.get('error', {}).get('message', 'Payment failed')
-            self._set_error(f"JustiFi: {error_msg}")
-        elif odoo_state == 'cancel':
-            self._set_canceled()
+                _logger.exception("JustiFi: Post-processing failed for transaction %s: %s", tx.reference, str(e))
+
+    def _justifi_apply_pending(self, payment_data):
+        """ Mark the transaction as pending. """
+        self._set_pending()
+
+    def _justifi_apply_error(self, payment_data):
+        """ Put the transaction in error with JustiFi's failure message. """
+        error_msg = (payment_data.get('error') or {}).get('message') or 'Payment failed'
+        self._set_error(f"JustiFi: {error_msg}")
+
+    def _justifi_apply_cancel(self, payment_data):
+        """ Cancel the transaction. """
+        self._set_canceled()
+
+    @api.model
+    def _cron_justifi_sync_pending(self):
+        """
+        Re-read JustiFi payments that are still pending after a while.
+
+        The complete endpoint trusts the webhook to settle a transaction once
+        the frontend reports a payment. If that webhook is lost, misrouted or
+        fails its signature check, the payment is fetched here instead, so a
+        charged customer's invoice still gets reconciled.
+
+        Transactions never synced come first; one still pending after a sync
+        waits PENDING_SYNC_INTERVAL before it is fetched again, so long-pending
+        payments don't crowd out recent ones.
+        """
+        now = fields.Datetime.now()
+        txs = self.search([
+            ('provider_code', '=', 'justifi'),
+            ('operation', '!=', 'refund'),
+            ('state', '=', 'pending'),
+            ('provider_reference', '!=', False),
+            ('last_state_change', '<=', now - timedelta(seconds=PENDING_SYNC_DELAY)),
+            ('create_date', '>=', now - timedelta(days=PENDING_SYNC_MAX_AGE_DAYS)),
+            '|',
+            ('justifi_last_sync', '=', False),
+            ('justifi_last_sync', '<=', now - timedelta(seconds=PENDING_SYNC_INTERVAL)),
+        ], order='justifi_last_sync asc nulls first, last_state_change desc', limit=PENDING_SYNC_BATCH_SIZE)
+
+        # Stamp the batch outside the savepoints so a failing sync still backs off
+        txs.write({'justifi_last_sync': now})
+        for tx in txs:
+            try:
+                with self.env.cr.savepoint():
+                    tx._justifi_sync_pending()
+            except Exception as e:
+                _logger.warning("JustiFi: Could not sync pending transaction %s: %s", tx.reference, str(e))
+
+    def _justifi_sync_pending(self):
+        """ Fetch this transaction's payment or checkout from JustiFi and apply its status. """
+        self.ensure_one()
+
+        reference = self.provider_reference
+        provider = self.provider_id.sudo()
+        if reference.startswith('py_'):
+            payment = provider._justifi_get_payment_details(reference)
+            if not payment.get('status'):
+                return
+            # The payment ID may have been reported by the browser; only trust its
+            # status if the payment is actually for this transaction's amount
+            amount_cents = payment_utils.to_minor_currency_units(self.amount, self.currency_id)
+            if (payment.get('amount') != amount_cents
+                    or (payment.get('currency') or '').upper() != self.currency_id.name):
+                _logger.warning(
+                    "JustiFi: Payment %s does not match transaction %s (%s %s), not syncing",
+                    reference, self.reference, payment.get('amount'), payment.get('currency'),
+                )
+                return
+            payment_data = {'status': payment['status'], 'successful_payment_id': reference}
+        elif reference.startswith('cho_'):
+            payment_data = provider._justifi_get_checkout(reference)
+        else:
+            return
+
+        _logger.info("JustiFi: Syncing pending transaction %s (%s)", self.reference, payment_data.get('status'))
+        self._justifi_process_payment_data(payment_data)
 
     def _send_refund_request(self):
         """
@@ -179,7 +377,7 @@ class PaymentTransaction(models.Model):
             ) % source_tx.reference)
 
         # Refund tx amount is signed-negative per Odoo core; JustiFi wants positive cents
-        amount_cents = int(round(abs(self.amount) * 100))
+        amount_cents = payment_utils.to_minor_currency_units(abs(self.amount), self.currency_id)
 
         description = _("Refund for %s") % source_tx.reference
         if self.invoice_ids:
@@ -250,21 +448,13 @@ class PaymentTransaction(models.Model):
         if not checkout_id and not payment_id:
             raise ValidationError("JustiFi: Missing checkout_id or payment_id in notification data")
 
-        # Try to find by checkout_id first (stored in provider_reference)
-        tx = provider.env['payment.transaction']
-
-        if checkout_id:
-            tx = tx.search([
-                ('provider_reference', '=', checkout_id),
-                ('provider_id', '=', provider.id),
-            ], limit=1)
-
-        # If not found, try by payment_id
-        if not tx and payment_id:
-            tx = tx.search([
-                ('provider_reference', '=', payment_id),
-                ('provider_id', '=', provider.id),
-            ], limit=1)
+        # provider_reference holds the checkout_id until the payment settles, then
+        # the payment_id; match either in a single query
+        references = [ref for ref in (checkout_id, payment_id) if ref]
+        tx = provider.env['payment.transaction'].search([
+            ('provider_reference', 'in', references),
+            ('provider_id', '=', provider.id),
+        ], limit=1)
 
         if not tx:
             _logger.error(
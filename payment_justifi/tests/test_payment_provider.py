@@ -0,0 +1,167 @@
+"""Unit tests for the JustiFi API client on payment.provider.
+
+Run on an Odoo.sh staging branch with:
+    odoo-bin -d <staging_db> -i payment_justifi \
+        --test-enable --test-tags=payment_justifi --stop-after-init
+"""
+from unittest.mock import MagicMock, patch
+
+import orjson
+
+from odoo.exceptions import ValidationError
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.payment_justifi.const import BREAKER_FAILURE_THRESHOLD
+from odoo.addons.payment_justifi.models import payment_provider as provider_module
+
+_API_URL = "https://api.justifi.ai/v1/test"
+
+
+def _response(status_code, payload=None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.content = orjson.dumps(payload or {})
+    resp.text = resp.content.decode()
+    return resp
+
+
+def _token_response(token):
+    return _response(200, {"access_token": token, "expires_in": 3600})
+
+
+@tagged("post_install", "-at_install", "-standard", "payment_justifi")
+class TestJustiFiPaymentProvider(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.provider = cls.env.ref("payment_justifi.payment_provider_justifi")
+        cls.provider.write({
+            "justifi_client_id": "test_client",
+            "justifi_client_secret": "test_secret",
+            "justifi_account_id": "acc_test",
+        })
+
+    def setUp(self):
+        super().setUp()
+        # Token cache, breaker and checkout cache are process-wide; isolate each test
+        for state in (provider_module._ACCESS_TOKEN_CACHE, provider_module._CHECKOUT_CACHE):
+            saved = dict(state)
+            state.clear()
+            self.addCleanup(state.update, saved)
+            self.addCleanup(state.clear)
+        saved_breaker = dict(provider_module._BREAKER)
+        provider_module._BREAKER.update(failures=0, window_start=0.0, opened_at=None)
+        self.addCleanup(provider_module._BREAKER.update, saved_breaker)
+
+        self.session = self._patch_session("_SESSION")
+        self.fast_session = self._patch_session("_FAST_SESSION")
+
+    def _patch_session(self, name):
+        patcher = patch.object(provider_module, name)
+        session = patcher.start()
+        self.addCleanup(patcher.stop)
+        return session
+
+    # ─── Access token cache ──────────────────────────────────────────────
+
+    def test_token_minted_once_for_consecutive_calls(self):
+        self.fast_session.post.return_value = _token_response("tok-1")
+        self.session.request.return_value = _response(200)
+
+        self.provider._justifi_make_request("GET", _API_URL)
+        self.provider._justifi_make_request("GET", _API_URL)
+
+        self.assertEqual(self.fast_session.post.call_count, 1)
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_401_evicts_token_and_retries_once(self):
+        """A rejected token is re-minted exactly once and the request replayed with it."""
+        self.fast_session.post.side_effect = [_token_response("tok-1"), _token_response("tok-2")]
+        self.session.request.side_effect = [_response(401), _response(200)]
+
+        response = self.provider._justifi_make_request("GET", _API_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.fast_session.post.call_count, 2)
+        auth_headers = [c.kwargs["headers"]["Authorization"] for c in self.session.request.call_args_list]
+        self.assertEqual(auth_headers, ["Bearer tok-1", "Bearer tok-2"])
+        self.assertEqual(self.provider._justifi_get_access_token(), "tok-2")
+
+    def test_second_401_is_returned_without_another_mint(self):
+        self.fast_session.post.side_effect = [_token_response("tok-1"), _token_response("tok-2")]
+        self.session.request.side_effect = [_response(401), _response(401)]
+
+        response = self.provider._justifi_make_request("GET", _API_URL)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(self.fast_session.post.call_count, 2)
+        self.assertEqual(self.session.request.call_count, 2)
+
+    # ─── Circuit breaker ─────────────────────────────────────────────────
+
+    def test_breaker_opens_after_threshold_failures(self):
+        self.fast_session.post.return_value = _token_response("tok-1")
+        self.session.request.return_value = _response(503)
+
+        for _i in range(BREAKER_FAILURE_THRESHOLD):
+            self.assertEqual(self.provider._justifi_make_request("GET", _API_URL).status_code, 503)
+
+        with self.assertRaises(ValidationError):
+            self.provider._justifi_make_request("GET", _API_URL)
+        self.assertEqual(self.session.request.call_count, BREAKER_FAILURE_THRESHOLD)
+
+    def test_breaker_counts_oauth_failures(self):
+        self.fast_session.post.return_value = _response(500)
+
+        for _i in range(BREAKER_FAILURE_THRESHOLD):
+            with self.assertRaises(ValidationError):
+                self.provider._justifi_make_request("GET", _API_URL)
+
+        self.assertTrue(provider_module._breaker_is_open())
+        self.session.request.assert_not_called()
+
+    def test_breaker_resets_on_success(self):
+        """A successful call clears the failure count, so the breaker stays closed."""
+        self.fast_session.post.return_value = _token_response("tok-1")
+        self.session.request.side_effect = (
+            [_response(503)] * (BREAKER_FAILURE_THRESHOLD - 1)
+            + [_response(200)]
+            + [_response(503)] * (BREAKER_FAILURE_THRESHOLD - 1)
+        )
+
+        for _i in range(2 * BREAKER_FAILURE_THRESHOLD - 1):
+            self.provider._justifi_make_request("GET", _API_URL)
+
+        self.assertFalse(provider_module._breaker_is_open())
+        self.assertEqual(provider_module._BREAKER["failures"], BREAKER_FAILURE_THRESHOLD - 1)
+
+    # ─── Final-status checkout cache ─────────────────────────────────────
+
+    def _get_checkout_twice(self, status):
+        self.fast_session.post.return_value = _token_response("tok-1")
+        self.fast_session.request.return_value = _response(200, {
+            "data": {"id": "cho_1", "status": status},
+        })
+        first = self.provider._justifi_get_checkout("cho_1")
+        second = self.provider._justifi_get_checkout("cho_1")
+        return first, second
+
+    def test_checkout_cached_for_final_status(self):
+        first, second = self._get_checkout_twice("completed")
+
+        self.assertEqual(self.fast_session.request.call_count, 1)
+        self.assertEqual(second, first)
+
+    def test_checkout_not_cached_while_pending(self):
+        self._get_checkout_twice("created")
+
+        self.assertEqual(self.fast_session.request.call_count, 2)
+
+    def test_cached_checkout_is_a_copy(self):
+        """Callers mutate checkout data (e.g. the complete endpoint); the cache must not change."""
+        first, _second = self._get_checkout_twice("failed")
+        first["checkout_id"] = "cho_other"
+
+        self.assertNotIn("checkout_id", self.provider._justifi_get_checkout("cho_1"))
+        self.assertEqual(self.fast_session.request.call_count, 1)
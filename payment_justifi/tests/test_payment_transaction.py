@@ -0,0 +1,100 @@
+"""Unit tests for JustiFi transaction processing.
+
+Run on an Odoo.sh staging branch with:
+    odoo-bin -d <staging_db> -i payment_justifi \
+        --test-enable --test-tags=payment_justifi --stop-after-init
+"""
+from unittest.mock import patch
+
+from odoo.tests import tagged
+
+from odoo.addons.payment.tests.common import PaymentCommon
+
+_TX_MODULE = "odoo.addons.payment_justifi.models.payment_transaction"
+
+
+def _payment_data(checkout_id, status, error=None):
+    return {
+        "id": checkout_id,
+        "status": status,
+        "successful_payment_id": "",
+        "error": error,
+    }
+
+
+@tagged("post_install", "-at_install", "-standard", "payment_justifi")
+class TestJustiFiPaymentTransaction(PaymentCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.justifi = cls._prepare_provider("justifi", update_values={
+            "justifi_client_id": "test_client",
+            "justifi_client_secret": "test_secret",
+            "justifi_account_id": "acc_test",
+        })
+        cls.provider = cls.justifi
+        cls.Transaction = cls.env["payment.transaction"]
+        cls.TransactionClass = type(cls.Transaction)
+
+    def setUp(self):
+        super().setUp()
+        # _create_transaction is an instance method, so transactions are made per test
+        self.tx_1 = self._create_transaction("direct", reference="JF-1", provider_reference="cho_1")
+        self.tx_2 = self._create_transaction("direct", reference="JF-2", provider_reference="cho_2")
+        self.tx_3 = self._create_transaction("direct", reference="JF-3", provider_reference="cho_3")
+
+    def _process(self, payment_data_list):
+        return self.Transaction._justifi_process_payment_data_multi(self.justifi, payment_data_list)
+
+    def test_multi_groups_done_transactions(self):
+        """Confirmed transactions share one _post_process call; others get their own state."""
+        with patch.object(self.TransactionClass, "_post_process", autospec=True) as post_process:
+            processed = self._process([
+                _payment_data("cho_1", "completed"),
+                _payment_data("cho_2", "completed"),
+                _payment_data("cho_3", "failed", error={"message": "Card declined"}),
+            ])
+
+        self.assertEqual(processed, self.tx_1 | self.tx_2 | self.tx_3)
+        self.assertEqual(post_process.call_count, 1)
+        self.assertEqual(post_process.call_args.args[0], self.tx_1 | self.tx_2)
+        self.assertEqual((self.tx_1 | self.tx_2).mapped("state"), ["done", "done"])
+        self.assertEqual(self.tx_3.state, "error")
+        self.assertIn("Card declined", self.tx_3.state_message)
+
+    def test_multi_null_error_payload(self):
+        """A payload with "error": null doesn't abort the batch, whatever its status."""
+        with patch.object(self.TransactionClass, "_post_process", autospec=True):
+            processed = self._process([
+                _payment_data("cho_1", "completed"),
+                _payment_data("cho_2", "failed"),
+            ])
+
+        self.assertEqual(processed, self.tx_1 | self.tx_2)
+        self.assertEqual(self.tx_1.state, "done")
+        self.assertEqual(self.tx_2.state, "error")
+        self.assertIn("Payment failed", self.tx_2.state_message)
+
+    def test_multi_post_process_failure_isolated(self):
+        """One transaction failing post-processing doesn't skip the others."""
+        succeeded = []
+
+        def _post_process(txs):
+            if self.tx_2 in txs:
+                raise ValueError("Invoice cannot be reconciled")
+            succeeded.extend(txs)
+
+        with patch.object(self.TransactionClass, "_post_process", autospec=True, side_effect=_post_process), \
+                self.assertLogs(_TX_MODULE, level="ERROR") as logs:
+            processed = self._process([
+                _payment_data("cho_1", "completed"),
+                _payment_data("cho_2", "completed"),
+                _payment_data("cho_3", "completed"),
+            ])
+
+        self.assertEqual(processed, self.tx_1 | self.tx_2 | self.tx_3)
+        self.assertEqual(set(succeeded), set(self.tx_1 | self.tx_3))
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("JF-2", logs.output[0])
+        self.assertEqual((self.tx_1 | self.tx_2 | self.tx_3).mapped("state"), ["done"] * 3)
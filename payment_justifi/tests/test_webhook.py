@@ -0,0 +1,47 @@
+"""Unit tests for the JustiFi webhook controller.
+
+Run on an Odoo.sh staging branch with:
+    odoo-bin -d <staging_db> -i payment_justifi \
+        --test-enable --test-tags=payment_justifi --stop-after-init
+"""
+import hashlib
+import hmac
+
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.payment_justifi.controllers.main import JustiFiController
+
+_SECRET = "whsec_test"
+_PAYLOAD = b'{"event_type": "payment.succeeded", "data": {"id": "py_1"}}'
+
+
+def _sign(payload, secret=_SECRET):
+    return hmac.new(secret.encode("utf-8"), payload, hashlib.sha256).hexdigest()
+
+
+@tagged("post_install", "-at_install", "-standard", "payment_justifi")
+class TestJustiFiWebhookSignature(TransactionCase):
+
+    def setUp(self):
+        super().setUp()
+        self.controller = JustiFiController()
+
+    def _verify(self, signature, payload=_PAYLOAD):
+        return self.controller._verify_webhook_signature(payload, signature, _SECRET)
+
+    def test_valid_signature(self):
+        self.assertTrue(self._verify(_sign(_PAYLOAD)))
+        self.assertTrue(self._verify(_sign(_PAYLOAD).upper()))
+
+    def test_invalid_signature(self):
+        """A signature for another secret or another body is rejected."""
+        self.assertFalse(self._verify(_sign(_PAYLOAD, secret="whsec_other")))
+        self.assertFalse(self._verify(_sign(_PAYLOAD + b" ")))
+        self.assertFalse(self._verify(_sign(_PAYLOAD)[:-2]))
+        self.assertFalse(self._verify(""))
+
+    def test_malformed_hex_signature(self):
+        """Non-hex or odd-length signatures are rejected rather than raising."""
+        self.assertFalse(self._verify("not-a-hex-signature"))
+        self.assertFalse(self._verify(_sign(_PAYLOAD)[:-1]))
+        self.assertFalse(self._verify("sha256=" + _sign(_PAYLOAD)))
@@ -5,6 +5,8 @@ import logging
 from odoo import _, api, fields, models
 from odoo.exceptions import ValidationError
 
+from odoo.addons.payment import utils as payment_utils
+
 _logger = logging.getLogger(__name__)
 
 
@@ -48,10 +50,7 @@ class AccountMoveTerminalPayment(models.TransientModel):
 
     def _get_provider(self):
         """Find the active JustiFi payment provider."""
-        provider = self.env['payment.provider'].sudo().search([
-            ('code', '=', 'justifi'),
-            ('state', '!=', 'disabled'),
-        ], limit=1)
+        provider = self.env['payment.provider']._justifi_get_active_provider()
         if not provider:
             raise ValidationError(_("No active JustiFi provider found."))
         return provider
@@ -62,7 +61,7 @@ class AccountMoveTerminalPayment(models.TransientModel):
 
         try:
             provider = self._get_provider()
-            amount_cents = int(self.amount * 100)
+            amount_cents = payment_utils.to_minor_currency_units(self.amount, self.currency_id)
             base_url = provider.get_base_url()
             invoice = self.invoice_id
 
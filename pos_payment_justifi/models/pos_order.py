@@ -99,10 +99,7 @@ class PosOrder(models.Model):
         payment_id = justifi_payment.transaction_id
 
         # Get the JustiFi provider
-        provider = self.env['payment.provider'].sudo().search([
-            ('code', '=', 'justifi'),
-            ('state', '!=', 'disabled'),
-        ], limit=1)
+        provider = self.env['payment.provider']._justifi_get_active_provider(self.company_id)
 
         if not provider:
             return
@@ -1,15 +1,15 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
 import logging
-import uuid
-import requests
 
 from odoo import api, fields, models
 
+from odoo.addons.payment import utils as payment_utils
+
 _logger = logging.getLogger(__name__)
 
-# JustiFi Terminal API URL
-TERMINALS_URL = 'https://api.justifi.ai/v1/terminals'
+# Checkout description when the POS doesn't send an order reference
+_POS_DEFAULT_DESC = 'POS Payment'
 
 
 class PosPaymentMethod(models.Model):
@@ -96,16 +96,14 @@ class PosPaymentMethod(models.Model):
             if not currency.exists():
                 return {'error': 'Currency not found'}
 
-            # Convert amount to cents
-            amount_cents = int(float(amount) * 100)
+            # Convert amount to minor units (cents for USD)
+            amount_cents = payment_utils.to_minor_currency_units(float(amount), currency)
 
             # Get base URL for origin
             base_url = provider.get_base_url()
 
             # Create checkout session
-            description = f"POS Payment"
-            if pos_order_id:
-                description = f"POS Order {pos_order_id}"
+            description = f"POS Order {pos_order_id}" if pos_order_id else _POS_DEFAULT_DESC
 
             checkout = provider._justifi_create_checkout(
                 amount=amount_cents,
@@ -118,8 +116,7 @@ class PosPaymentMethod(models.Model):
             _logger.info("JustiFi POS: Checkout created: %s", checkout_id)
 
             # Send payment to terminal
-            terminal_response = self._justifi_send_to_terminal(
-                provider=provider,
+            terminal_response = provider._justifi_send_to_terminal(
                 terminal_id=self.justifi_terminal_id,
                 checkout_id=checkout_id,
             )
@@ -154,14 +151,11 @@ class PosPaymentMethod(models.Model):
         :param terminal_action_id: Optional terminal action ID
         :return: dict with payment status
         """
-        _logger.info("JustiFi POS: Status check - checkout=%s, action=%s", checkout_id, terminal_action_id)
+        _logger.debug("JustiFi POS: Status check - checkout=%s, action=%s", checkout_id, terminal_action_id)
 
         try:
             # Find the JustiFi provider
-            provider = self.env['payment.provider'].search([
-                ('code', '=', 'justifi'),
-                ('state', '!=', 'disabled'),
-            ], limit=1)
+            provider = self.env['payment.provider']._justifi_get_active_provider(self.env.company)
 
             if not provider:
                 return {'error': 'JustiFi provider not found'}
@@ -171,7 +165,7 @@ class PosPaymentMethod(models.Model):
             status = checkout.get('status', '')
             payment_id = checkout.get('successful_payment_id', '')
 
-            _logger.info("JustiFi POS: Checkout %s status=%s, payment=%s", checkout_id, status, payment_id)
+            _logger.debug("JustiFi POS: Checkout %s status=%s, payment=%s", checkout_id, status, payment_id)
 
             return {
                 'success': True,
@@ -202,17 +196,13 @@ class PosPaymentMethod(models.Model):
 
         try:
             # Find the JustiFi provider
-            provider = self.env['payment.provider'].search([
-                ('code', '=', 'justifi'),
-                ('state', '!=', 'disabled'),
-            ], limit=1)
+            provider = self.env['payment.provider']._justifi_get_active_provider(self.env.company)
 
             if not provider:
                 return {'error': 'JustiFi provider not found'}
 
             # Cancel the terminal action
-            self._justifi_cancel_terminal_action(
-                provider=provider,
+            provider._justifi_cancel_terminal_action(
                 terminal_id=terminal_id,
                 checkout_id=checkout_id,
             )
@@ -227,93 +217,3 @@ class PosPaymentMethod(models.Model):
         except Exception as e:
             _logger.exception("JustiFi POS: Error cancelling payment: %s", str(e))
             return {'error': str(e)}
-
-    def _justifi_send_to_terminal(self, provider, terminal_id, checkout_id):
-        """
-        Send a checkout to a JustiFi terminal for payment.
-
-        :param provider: The payment.provider record
-        :param terminal_id: The terminal ID (trm_xxxxx)
-        :param checkout_id: The checkout ID (cho_xxxxx)
-        :return: API response dict
-        """
-        access_token = provider._justifi_get_access_token()
-
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json',
-            'Sub-Account': provider.justifi_account_id,
-            'Idempotency-Key': str(uuid.uuid4()),
-        }
-
-        # Correct endpoint: POST /v1/terminals/pay (terminal_id in body, not URL)
-        url = f'{TERMINALS_URL}/pay'
-        payload = {
-            'checkout_id': checkout_id,
-            'terminal_id': terminal_id,
-        }
-
-        _logger.info("JustiFi POS: Sending to terminal %s: %s", terminal_id, payload)
-
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
-
-        _logger.info(
-            "JustiFi POS: Terminal response: %s %s",
-            response.status_code, response.text[:500] if response.text else ''
-        )
-
-        if response.status_code >= 400:
-            error_msg = "Failed to send payment to terminal"
-            try:
-                error_data = response.json()
-                if 'error' in error_data and 'message' in error_data['error']:
-                    error_msg = error_data['error']['message']
-            except Exception:
-                pass
-            raise Exception(error_msg)
-
-        data = response.json()
-        return data.get('data', data)
-
-    @api.model
-    def _justifi_cancel_terminal_action(self, provider, terminal_id, checkout_id):
-        """
-        Cancel a terminal payment action.
-
-        :param provider: The payment.provider record
-        :param terminal_id: The terminal ID
-        :param checkout_id: The checkout ID
-        :return: API response dict
-        """
-        access_token = provider._justifi_get_access_token()
-
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json',
-            'Sub-Account': provider.justifi_account_id,
-        }
-
-        url = f'{TERMINALS_URL}/cancel'
-        payload = {
-            'checkout_id': checkout_id,
-            'terminal_id': terminal_id,
-        }
-
-        _logger.info("JustiFi POS: Cancelling terminal %s action for checkout %s", terminal_id, checkout_id)
-
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
-
-        _logger.info(
-            "JustiFi POS: Cancel response: %s %s",
-            response.status_code, response.text[:200] if response.text else ''
-        )
-
-        if response.status_code >= 400:
-            _logger.warning("JustiFi POS: Cancel may have failed: %s", response.text)
-            # Don't raise - cancellation might fail if payment already completed
-
-        try:
-            data = response.json()
-            return data.get('data', data)
-        except Exception:
-            return {}
@@ -18,6 +18,8 @@ export class PaymentJustifi extends PaymentInterface {
         super.setup(pos, payment_method_id);
         this.pollingInterval = null;
         this.pollingTimeout = null;
+        // Bumped whenever polling stops, so in-flight polls can tell they are stale
+        this.pollingLoopId = 0;
     }
 
     /**
@@ -99,20 +101,39 @@ export class PaymentJustifi extends PaymentInterface {
         const MAX_POLL_TIME = 95000; // 95 seconds (JustiFi terminal sessions timeout at 90s)
         const POLL_INTERVAL = 2000; // 2 seconds
         const startTime = Date.now();
+        const loopId = ++this.pollingLoopId;
+        const checkoutId = paymentLine.justifi_checkout_id;
 
         return new Promise((resolve) => {
-            const pollStatus = async () => {
+            /**
+             * Settle the loop if it was superseded or the line changed state
+             * outside of it. Returns true when polling should go on.
+             */
+            const isCurrent = () => {
+                // A cancel or a newer request took over: leave its timer and the line alone
+                if (loopId !== this.pollingLoopId || paymentLine.justifi_checkout_id !== checkoutId) {
+                    resolve(false);
+                    return false;
+                }
+
                 // Check if cancelled or user clicked retry
                 if (paymentLine.payment_status === "retry" || paymentLine.payment_status === "cancelled") {
                     this._stopPolling();
                     resolve(false);
-                    return;
+                    return false;
                 }
 
                 // Check if Force Done was clicked (status set to "done" externally)
                 if (paymentLine.payment_status === "done") {
                     this._stopPolling();
                     resolve(true);
+                    return false;
+                }
+                return true;
+            };
+
+            const pollStatus = async () => {
+                if (!isCurrent()) {
                     return;
                 }
 
@@ -137,6 +158,11 @@ export class PaymentJustifi extends PaymentInterface {
                         }
                     );
 
+                    // The line may have been cancelled, retried or forced while we waited
+                    if (!isCurrent()) {
+                        return;
+                    }
+
                     console.log("JustiFi: Status poll result", status);
 
                     if (status.error) {
@@ -164,6 +190,9 @@ export class PaymentJustifi extends PaymentInterface {
                 } catch (error) {
                     console.error("JustiFi: Status poll error", error);
                     // Continue polling on network errors
+                    if (!isCurrent()) {
+                        return;
+                    }
                 }
 
                 // Schedule next poll
@@ -179,6 +208,7 @@ export class PaymentJustifi extends PaymentInterface {
      * Stop the polling loop.
      */
     _stopPolling() {
+        this.pollingLoopId++;
         if (this.pollingTimeout) {
             clearTimeout(this.pollingTimeout);
             this.pollingTimeout = null;